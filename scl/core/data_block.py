@@ -1,3 +1,4 @@
+import time
 from typing import List, Set
 from scl.core.prob_dist import ProbabilityDist
 
@@ -106,6 +107,51 @@ class DataBlock:
         return prob_dist.entropy
 
 
+class DataBlockPool:
+    """freelist of reusable DataBlock objects
+
+    Allocating a fresh list + DataBlock for every block in a tight encode/decode loop creates
+    avoidable GC pressure. The pool keeps released blocks (with their preallocated data_list
+    buffers) around for reuse: acquire(size) returns a block whose data_list has exactly `size`
+    slots, reusing a released block's buffer when possible.
+
+    Usage is opt-in: the consumer fills block.data_list in place and calls release(block) when
+    done with it. Blocks which are never released are simply reclaimed by the GC as usual.
+    Released blocks idle for longer than MAX_IDLE_TIME are dropped, so a short-term peak in
+    block usage does not cause persistent memory bloat.
+    """
+
+    # seconds a released block may sit in the freelist before being dropped
+    MAX_IDLE_TIME = 0.5
+
+    def __init__(self):
+        # list of (release_timestamp, DataBlock) tuples
+        self._freelist = []
+
+    def acquire(self, size: int) -> DataBlock:
+        """return a DataBlock whose data_list has `size` slots (contents are undefined)"""
+        self._drop_stale()
+        if self._freelist:
+            _, block = self._freelist.pop()
+            buf = block.data_list
+            # resize the reused buffer in place to the requested size
+            if len(buf) < size:
+                buf.extend([None] * (size - len(buf)))
+            elif len(buf) > size:
+                del buf[size:]
+            return block
+        return DataBlock([None] * size)
+
+    def release(self, block: DataBlock):
+        """return a block to the pool for reuse"""
+        self._freelist.append((time.monotonic(), block))
+
+    def _drop_stale(self):
+        """drop released blocks which have been idle for longer than MAX_IDLE_TIME"""
+        now = time.monotonic()
+        self._freelist = [(t, b) for (t, b) in self._freelist if now - t <= self.MAX_IDLE_TIME]
+
+
 def test_data_block_basic_ops():
     """checks basic operations for a DataBlock"""
     data_list = [0, 1, 0, 0, 1, 1]
@@ -127,3 +173,22 @@ def test_data_block_basic_ops():
     # check entropy
     entropy = data_block.get_entropy(order=0)
     assert entropy == 1.0
+
+
+def test_data_block_pool():
+    """checks that released DataBlocks are reused (with buffers resized to the request)"""
+    pool = DataBlockPool()
+
+    block = pool.acquire(4)
+    assert block.size == 4
+    pool.release(block)
+
+    # the released block is reused, resized to the new request
+    reused = pool.acquire(2)
+    assert reused is block
+    assert reused.size == 2
+
+    # with an empty freelist, a fresh block is allocated
+    fresh = pool.acquire(3)
+    assert fresh is not block
+    assert fresh.size == 3
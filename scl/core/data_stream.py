@@ -1,9 +1,63 @@
 import abc
+import functools
+import io
+import itertools
+import mmap
+import queue
 import tempfile
+import threading
 import os
 import typing
+import numpy as np
 from scl.core.data_block import DataBlock
 
+# numba is optional: when available, the byte-buffer fill below runs as a compiled
+# (GIL-releasing) loop; otherwise we fall back to the equivalent numpy copy
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+
+    @njit(cache=True, nogil=True)
+    def _fill_from_bytes(buf, out):
+        for i in range(out.shape[0]):
+            out[i] = buf[i]
+
+
+def _uint8_array_from_bytes(data: bytes) -> np.ndarray:
+    """convert a bytes buffer to a writable contiguous uint8 array
+
+    uses the numba-compiled fill loop when numba is installed (which also releases the GIL,
+    so it composes with the prefetch thread), and a numpy copy otherwise
+    """
+    if njit is not None:
+        out = np.empty(len(data), dtype=np.uint8)
+        _fill_from_bytes(np.frombuffer(data, dtype=np.uint8), out)
+        return out
+    return np.frombuffer(data, dtype=np.uint8).copy()
+
+
+@functools.singledispatch
+def _make_block(seq) -> DataBlock:
+    """wrap a symbol container in a DataBlock, copying only when needed
+
+    The dispatch is on the container type: containers which DataBlock can index directly
+    (list, bytes -- which indexes as ints -- and np.ndarray) are wrapped as-is, so the hot
+    get_block path does not pay a list(...) copy when the source is already contiguous.
+    Any other sequence falls back to a list copy.
+    """
+    return DataBlock(list(seq))
+
+
+@_make_block.register(list)
+@_make_block.register(bytes)
+@_make_block.register(np.ndarray)
+def _(seq) -> DataBlock:
+    return DataBlock(seq)
+
+
 Symbol = typing.Any
 
 
@@ -20,6 +74,10 @@ class DataStream(abc.ABC):
     (see their description for more details)
     """
 
+    # NOTE: the stream classes declare __slots__: instances carry no __dict__, which keeps them
+    # small and makes attribute access in the per-symbol hot loops a single C-level dereference
+    __slots__ = ()
+
     @abc.abstractmethod
     def seek(self, pos: int):
         """seek a particular position in the data stream"""
@@ -29,15 +87,53 @@ class DataStream(abc.ABC):
     def get_symbol(self):
         """returns a symbol from the data stream, returns None if the stream is finished
 
-        This is an abstract method, and hence needs to be implemented by the subclasses
+        This is an abstract method, and hence needs to be implemented by the subclasses.
+
+        NOTE: get_symbol is the slow fallback path, only exercised when a subclass does not
+        override get_batch; block reads go through get_batch, which fetches data in bulk and
+        signals the end of the stream with a short (or empty) batch instead of a per-symbol
+        None check
         """
         pass
 
+    def __iter__(self):
+        """iterate over the symbols of the stream until it is exhausted"""
+        # NOTE: the bound method is hoisted out of the loop; this avoids an attribute
+        # lookup per symbol, which is measurable for long streams
+        get_symbol = self.get_symbol
+        while True:
+            s = get_symbol()
+            if s is None:
+                return
+            yield s
+
+    def get_batch(self, block_size: int) -> typing.List:
+        """returns a list of (at most) block_size symbols from the stream
+
+        The default implementation drains (at most) block_size symbols from the symbol iterator
+        via itertools.islice, so the per-batch counting happens in C rather than in python
+        bytecode. Subclasses for which a whole batch can be obtained in one operation (eg: a
+        list slice, a bulk file read) should override get_batch, so that get_block avoids the
+        per-symbol dispatch entirely.
+
+        Args:
+            block_size (int): the (max) number of symbols to return
+
+        Returns:
+            List: list of symbols (can be shorter than block_size if the stream ends)
+        """
+        return list(itertools.islice(iter(self), block_size))
+
     def get_block(self, block_size: int) -> DataBlock:
         """returns a block of data (of the given max size) from the stream
 
         get_block function tries to return a block of size `block_size`.
-        In case the remaining stream is shorter, a smaller block will be returned
+        In case the remaining stream is shorter, a smaller block will be returned.
+
+        End-of-stream contract: get_batch overrides must return a shorter (possibly empty)
+        batch once the stream runs out -- the natural short-read semantics of file reads and
+        slices -- rather than checking each symbol against None. get_block maps an empty batch
+        to the terminating None block.
 
         Args:
             block_size (int): the (max) size of the block of data to be returned.
@@ -45,22 +141,15 @@ class DataStream(abc.ABC):
         Returns:
             DataBlock:
         """
-        # NOTE: we implement get_block as a loop over get_symbol function
-        # this is not the most optimal way of imeplemting get_block (as reading a block of data at once might be faster)
-        # TODO: investigate faster ways of directly reading a block
-        data_list = []
-        for _ in range(block_size):
-            # get next symbol
-            s = self.get_symbol()
-            if s is None:
-                break
-            data_list.append(s)
+        # NOTE: the actual data retrieval is delegated to get_batch, which subclasses
+        # override to fetch the whole batch in a single operation where possible
+        data_list = self.get_batch(block_size)
 
         # if data_list is empty, return None to signal the stream is over
-        if not data_list:
+        if len(data_list) == 0:
             return None
 
-        return DataBlock(data_list)
+        return _make_block(data_list)
 
     @abc.abstractmethod
     def write_symbol(self, s):
@@ -112,11 +201,17 @@ class ListDataStream(DataStream):
     (as usually you would read data from a file.. see FileDataStream for that)
     """
 
-    def __init__(self, input_list: typing.List):
+    __slots__ = ("input_list", "current_ind", "_write_idx")
+
+    def __init__(self, input_list: typing.List, capacity_hint: int = None):
         """initialize with input_list and reset the stream
 
         Args:
             input_list (List): the list of symbols, around which the class is a wrapper
+            capacity_hint (int, optional): if provided, preallocate capacity_hint extra slots in
+            input_list so that subsequent writes fill the preallocated region in place instead of
+            growing the list one append at a time. Useful when the number of symbols to be
+            written is (approximately) known upfront.
 
         Usage:
             with ListDataStream(input_list) as ds:
@@ -127,14 +222,20 @@ class ListDataStream(DataStream):
         assert isinstance(input_list, list)
         self.input_list = input_list
 
-        # set the position counter
+        # set the position counters (writes append right after the existing symbols)
         self.current_ind = 0
+        self._write_idx = len(input_list)
+
+        # preallocate the write arena if a capacity hint was given
+        if capacity_hint is not None:
+            self.input_list.extend([None] * capacity_hint)
 
     def seek(self, pos: int):
-        """set the current_ind to a particular pos"""
+        """set the read/write position to a particular pos"""
 
         assert pos <= len(self.input_list)
         self.current_ind = pos
+        self._write_idx = pos
 
     def get_symbol(self) -> Symbol:
         """returns the next symbol from the self.input_list"""
@@ -148,16 +249,119 @@ class ListDataStream(DataStream):
         self.current_ind += 1
         return s
 
+    def get_batch(self, block_size: int) -> typing.List:
+        """returns the next batch of symbols as a single list slice
+
+        the slice is a C-level copy of the pointers, which avoids the per-symbol
+        get_symbol dispatch and bounds check
+        """
+        out = self.input_list[self.current_ind : self.current_ind + block_size]
+        self.current_ind += len(out)
+        return out
+
     def write_symbol(self, s: Symbol):
-        """write a symbol to the stream"""
-        assert self.current_ind <= len(self.input_list)
+        """write a symbol to the stream
 
-        # the case where we modify a symbol
-        if self.current_ind < len(self.input_list):
-            self.input_list[self.current_ind] = s
+        writes fill preallocated slots in place (see capacity_hint in __init__) and only fall
+        back to list.append once the preallocated region is exhausted
+        """
+        assert self._write_idx <= len(self.input_list)
+
+        # the case where we modify a symbol (or fill a preallocated slot)
+        if self._write_idx < len(self.input_list):
+            self.input_list[self._write_idx] = s
         else:
             # case where we append a symbol
             self.input_list.append(s)
+        self._write_idx += 1
+
+    def write_block(self, data_block: DataBlock):
+        """write the input block to the stream
+
+        the portion of the block which fits in existing (or preallocated) slots is written with
+        a single slice assignment, and any remainder with a single list.extend -- both C-level
+        operations, instead of a python loop over write_symbol
+
+        Args:
+            data_block (DataBlock): block to be written to the stream
+        """
+        data = data_block.data_list
+        idx = self._write_idx
+        num_in_place = min(len(data), len(self.input_list) - idx)
+        if num_in_place > 0:
+            self.input_list[idx : idx + num_in_place] = data[:num_in_place]
+        if num_in_place < len(data):
+            self.input_list.extend(data[num_in_place:])
+        self._write_idx = idx + len(data)
+
+
+class PrefetchingDataStream(DataStream):
+    """read-only DataStream decorator which prefetches blocks on a background thread
+
+    A background thread repeatedly calls get_block on the wrapped stream and pushes the blocks
+    into a bounded queue; get_block on the wrapper just pops from the queue. This overlaps the
+    (typically I/O bound) block reads with the downstream codec work, so the wall-clock time
+    approaches max(read_time, compute_time) instead of their sum. File reads release the GIL,
+    so the prefetch thread genuinely runs concurrently with compute.
+
+    NOTE: the block size is fixed at construction time (the block_size passed to get_block is
+    ignored), and the stream is read-only (seek/write_symbol are not supported)
+
+    Usage:
+        with TextFileDataStream(path, "r") as fds:
+            prefetcher = PrefetchingDataStream(fds, block_size=10000)
+            while (block := prefetcher.get_block(10000)) is not None:
+                # process block while the next one is being read
+    """
+
+    __slots__ = ("block_queue", "_stream_finished", "_prefetch_thread")
+
+    def __init__(self, inner_stream: DataStream, block_size: int, depth: int = 4):
+        """start prefetching blocks of block_size from inner_stream
+
+        Args:
+            inner_stream (DataStream): the stream to prefetch blocks from
+            block_size (int): size of the blocks fetched from inner_stream
+            depth (int, optional): max number of blocks buffered ahead. Defaults to 4.
+        """
+        self.block_queue = queue.Queue(maxsize=depth)
+        self._stream_finished = False
+        self._prefetch_thread = threading.Thread(
+            target=self._prefetch_loop, args=(inner_stream, block_size), daemon=True
+        )
+        self._prefetch_thread.start()
+
+    def _prefetch_loop(self, inner_stream: DataStream, block_size: int):
+        """body of the prefetch thread: read blocks until the inner stream is exhausted
+
+        the terminating None block is pushed onto the queue as the end-of-stream sentinel
+        """
+        while True:
+            block = inner_stream.get_block(block_size)
+            self.block_queue.put(block)
+            if block is None:
+                break
+
+    def get_block(self, block_size: int = None) -> DataBlock:
+        """pop the next prefetched block (block_size is ignored, see class docstring)"""
+        if self._stream_finished:
+            return None
+        block = self.block_queue.get()
+        if block is None:
+            self._stream_finished = True
+        return block
+
+    def seek(self, pos: int):
+        """seeking is not supported while prefetching"""
+        raise NotImplementedError("PrefetchingDataStream does not support seek")
+
+    def get_symbol(self):
+        """per-symbol access is not supported; use get_block"""
+        raise NotImplementedError("PrefetchingDataStream only supports block access")
+
+    def write_symbol(self, s):
+        """the prefetching stream is read-only"""
+        raise NotImplementedError("PrefetchingDataStream is read-only")
 
 
 class FileDataStream(DataStream):
@@ -170,16 +374,26 @@ class FileDataStream(DataStream):
     to get a functional object.
     """
 
-    def __init__(self, file_path: str, permissions="r"):
+    __slots__ = ("file_path", "permissions", "file_obj", "buffer_size")
+
+    # default io buffer size (in bytes) used when opening the file.
+    # python's default is 8 KiB; a larger buffer means fewer syscalls on sequential reads/writes
+    DEFAULT_BUFFER_SIZE = 1 << 17  # 128 KiB
+
+    def __init__(self, file_path: str, permissions="r", buffer_size: int = None):
         """Initialize the FileDataStream object
 
         Args:
             file_path (str): path of the file to read from/write to
             permissions (str, optional): Permissions to open the file obj. Use "r" to read, "w" to write to
             (other pyhton file obj permissions also can be used). Defaults to "r".
+            buffer_size (int, optional): size (in bytes) of the io buffer used by the file object.
+            Defaults to DEFAULT_BUFFER_SIZE (128 KiB), which reduces the number of syscalls needed
+            for sequential access compared to python's 8 KiB default.
         """
         self.file_path = file_path
         self.permissions = permissions
+        self.buffer_size = buffer_size if buffer_size is not None else self.DEFAULT_BUFFER_SIZE
 
     def __enter__(self):
         """open the file object context based on the permissions specified
@@ -197,46 +411,372 @@ class FileDataStream(DataStream):
             block = fds.get_block(5)
 
         """
-        self.file_obj = open(self.file_path, self.permissions)
+        self.file_obj = open(self.file_path, self.permissions, buffering=self.buffer_size)
+
+        # for read streams, tell the kernel the access pattern is sequential so it can
+        # perform aggressive readahead (posix_fadvise is not available on all platforms)
+        if hasattr(os, "posix_fadvise") and "r" in self.permissions:
+            os.posix_fadvise(self.file_obj.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
         return self
 
     def __exit__(self, exc_type, exc_value, exc_traceback):
         """close the file object at the end of context
 
+        for write streams, the written pages are hinted as not-needed, so compressed output
+        which is never reread does not stay in (and thrash) the page cache
+
         please take a look __enter__ docstring for more info.
         Reference: https://realpython.com/python-with-statement/
         """
+        if hasattr(os, "posix_fadvise") and ("w" in self.permissions or "a" in self.permissions):
+            self.file_obj.flush()
+            os.posix_fadvise(self.file_obj.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
         self.file_obj.close()
 
     def seek(self, pos: int):
         """resets the file object to the beginning"""
         self.file_obj.seek(pos)
 
+    def _symbols_from_bytes(self, data: bytes):
+        """convert a raw bytes buffer to the stream's symbol container (or None if unsupported)
+
+        get_blocks below reads raw bytes straight from the file descriptor, so it can only be
+        used by streams for which one byte corresponds to one symbol. Such subclasses override
+        this hook; the default None disables the scatter-gather path.
+        """
+        return None
+
+    def get_blocks(self, num_blocks: int, block_size: int) -> typing.List[DataBlock]:
+        """read (up to) num_blocks blocks, filling all their buffers with one readv syscall
+
+        os.readv scatters a single read across num_blocks preallocated buffers, so one syscall
+        (and one context switch) populates what would otherwise take num_blocks reads. This is
+        useful e.g. to fill a whole prefetch queue or hand one block to each of K workers.
+
+        Falls back to repeated get_block calls when readv is unavailable on the platform or
+        when the stream has no byte-to-symbol conversion (see _symbols_from_bytes).
+
+        Args:
+            num_blocks (int): the (max) number of blocks to return
+            block_size (int): the (max) size of each block
+
+        Returns:
+            List[DataBlock]: the blocks read; fewer (or none) if the stream ends
+        """
+        if not hasattr(os, "readv") or self._symbols_from_bytes(b"") is None:
+            # fallback: one read per block
+            blocks = []
+            for _ in range(num_blocks):
+                block = self.get_block(block_size)
+                if block is None:
+                    break
+                blocks.append(block)
+            return blocks
+
+        # sync the file descriptor offset with the (buffered) file object position,
+        # scatter one readv across the block buffers, then resync the file object
+        buffers = [bytearray(block_size) for _ in range(num_blocks)]
+        pos = self.file_obj.tell()
+        fd = self.file_obj.fileno()
+        os.lseek(fd, pos, os.SEEK_SET)
+        total_read = os.readv(fd, buffers)
+        self.file_obj.seek(pos + total_read)
+
+        blocks = []
+        for buf in buffers:
+            if total_read <= 0:
+                break
+            num_in_buf = min(total_read, block_size)
+            blocks.append(_make_block(self._symbols_from_bytes(bytes(buf[:num_in_buf]))))
+            total_read -= num_in_buf
+        return blocks
+
 
 class TextFileDataStream(FileDataStream):
-    """FileDataStream to read/write text data"""
+    """FileDataStream to read/write text data
+
+    reads are tiled internally: the file is read in chunks of TILE_SIZE chars held in an
+    in-process buffer, and get_symbol/get_batch requests are served out of that buffer. One
+    physical read thus covers many small requests, so codecs asking for tiny blocks do not pay
+    the full read overhead per call
+    """
+
+    __slots__ = ("_read_buf", "_read_buf_pos", "_write_buf", "ascii_only")
+
+    # number of chars fetched per physical read; small requests are served from this tile
+    TILE_SIZE = 1 << 16
+
+    # staged writes are flushed to the file once this many chars accumulate
+    FLUSH_THRESHOLD = 1 << 20
+
+    def __init__(
+        self, file_path: str, permissions="r", buffer_size: int = None, ascii_only: bool = False
+    ):
+        """see FileDataStream.__init__ for the common args
+
+        Args:
+            ascii_only (bool, optional): if True, the file is known to contain only ASCII chars
+            and is opened in binary mode: reads decode and writes encode a whole tile/flush at a
+            time with the trivial ascii codec, bypassing python's per-read text-mode machinery.
+            Symbols are still served as (single-char) strs. Defaults to False.
+        """
+        self.ascii_only = ascii_only
+        if ascii_only and "b" not in permissions:
+            permissions += "b"
+        super().__init__(file_path, permissions, buffer_size)
+        # the read tile and the position up to which it has been consumed
+        self._read_buf = ""
+        self._read_buf_pos = 0
+        # staging buffer for writes (see write_symbol)
+        self._write_buf = io.StringIO()
+
+    def _symbols_from_bytes(self, data: bytes):
+        """one byte per char holds only for ascii streams; see FileDataStream.get_blocks"""
+        if self.ascii_only:
+            return list(data.decode("ascii"))
+        return None
+
+    def get_blocks(self, num_blocks: int, block_size: int) -> typing.List[DataBlock]:
+        """see FileDataStream.get_blocks
+
+        before handing over to the raw-descriptor readv path, staged writes are flushed and the
+        file position is rewound by the unconsumed part of the read tile (only meaningful in
+        ascii/binary mode, where tell() is a byte offset)
+        """
+        self.flush()
+        if self.ascii_only:
+            unconsumed = len(self._read_buf) - self._read_buf_pos
+            if unconsumed:
+                self.file_obj.seek(self.file_obj.tell() - unconsumed)
+            self._read_buf = ""
+            self._read_buf_pos = 0
+        return super().get_blocks(num_blocks, block_size)
+
+    def _read_chars(self, n: int) -> str:
+        """read (up to) n chars from the file; in ascii mode the bytes are decoded in one call"""
+        data = self.file_obj.read(n)
+        if self.ascii_only:
+            return data.decode("ascii")
+        return data
+
+    def flush(self):
+        """flush any staged writes to the underlying file"""
+        payload = self._write_buf.getvalue()
+        if payload:
+            if self.ascii_only:
+                self.file_obj.write(payload.encode("ascii"))
+            else:
+                self.file_obj.write(payload)
+            self._write_buf.seek(0)
+            self._write_buf.truncate()
+
+    def seek(self, pos: int):
+        """seek the file position
+
+        staged writes are flushed first (so they land before the old position), and the read
+        tile is discarded as it no longer matches the new position
+        """
+        self.flush()
+        super().seek(pos)
+        self._read_buf = ""
+        self._read_buf_pos = 0
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """flush staged writes before the file object is closed"""
+        self.flush()
+        super().__exit__(exc_type, exc_value, exc_traceback)
 
     def get_symbol(self):
         """get the next character from the text file
 
-        as we read character data from file by default, the get_symbol function does not need to do anything special
-        conversions
+        the character is served from the read tile, so consecutive get_symbol calls only hit
+        the file once per TILE_SIZE chars
 
         Returns:
             (str, None): the next character, None if we reached the end of stream
         """
-        s = self.file_obj.read(1)
-        if not s:
-            return None
+        if self._read_buf_pos >= len(self._read_buf):
+            self._read_buf = self._read_chars(self.TILE_SIZE)
+            self._read_buf_pos = 0
+            if not self._read_buf:
+                return None
+        s = self._read_buf[self._read_buf_pos]
+        self._read_buf_pos += 1
         return s
 
+    def get_batch(self, block_size: int) -> typing.List:
+        """read a batch of characters, refilling the read tile as needed
+
+        when the tile cannot satisfy the request, one read of max(block_size, TILE_SIZE) chars
+        refills it, so even a sequence of tiny batch requests results in few physical reads.
+        In case the remaining file is shorter, a smaller batch is returned (consistent with
+        DataStream.get_batch)
+        """
+        available = len(self._read_buf) - self._read_buf_pos
+        if available < block_size:
+            # refill: keep the unconsumed carryover and append a fresh read
+            carryover = self._read_buf[self._read_buf_pos :]
+            self._read_buf = carryover + self._read_chars(
+                max(block_size - available, self.TILE_SIZE)
+            )
+            self._read_buf_pos = 0
+        out = self._read_buf[self._read_buf_pos : self._read_buf_pos + block_size]
+        self._read_buf_pos += len(out)
+        return list(out)
+
     def write_symbol(self, s):
-        """write a character to the text file"""
-        self.file_obj.write(s)
+        """write a character to the text file
+
+        the character is staged in an in-memory buffer; the staged chars cross into the
+        C-level text encoder in one call per FLUSH_THRESHOLD chars (on flush) instead of
+        one call per character
+        """
+        self._write_buf.write(s)
+        if self._write_buf.tell() >= self.FLUSH_THRESHOLD:
+            self.flush()
+
+    def write_block(self, data_block: DataBlock):
+        """write the whole block with a single staged write
+
+        joining the characters first replaces one write call per symbol with a single
+        str.join and a single staged write
+
+        Args:
+            data_block (DataBlock): block to be written to the stream
+        """
+        self._write_buf.write("".join(data_block.data_list))
+        if self._write_buf.tell() >= self.FLUSH_THRESHOLD:
+            self.flush()
+
+
+class MmapTextFileDataStream(FileDataStream):
+    """read-only FileDataStream which memory-maps an ASCII text file
+
+    Instead of copying bytes from the kernel page cache into userspace buffers on every read,
+    the file is mapped into the process address space once, and symbols/blocks are served as
+    slices of the mapping. This avoids both the per-read syscall and the kernel->userspace copy.
+
+    NOTE: like TextFileDataStream's ascii_only mode, this class assumes single-byte (ASCII)
+    chars: blocks are byte slices of the mapping, so a multi-byte (eg UTF-8) char could straddle
+    a block boundary. Slices are decoded as ascii, so non-ASCII input raises UnicodeDecodeError
+    immediately instead of failing only when a boundary happens to split a char.
+
+    NOTE: the stream is read-only (write_symbol is not supported)
+    """
+
+    __slots__ = ("_mm", "_pos")
+
+    def __init__(self, file_path: str):
+        super().__init__(file_path, permissions="r")
+
+    def __enter__(self):
+        """open the file and memory-map it for reading
+
+        We advise the kernel that access will be sequential (where madvise is available),
+        which enables aggressive readahead.
+        """
+        self.file_obj = open(self.file_path, self.permissions, buffering=self.buffer_size)
+        if os.fstat(self.file_obj.fileno()).st_size == 0:
+            # empty files cannot be mmap'd; serve an exhausted stream instead
+            # (consistent with the other streams, which return None from get_block)
+            self._mm = b""
+        else:
+            self._mm = mmap.mmap(self.file_obj.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(self._mm, "madvise"):
+                self._mm.madvise(mmap.MADV_SEQUENTIAL)
+        self._pos = 0
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """close the mapping and then the underlying file object"""
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+        self.file_obj.close()
+
+    def seek(self, pos: int):
+        """set the read position inside the mapping"""
+        self._pos = pos
+
+    def get_symbol(self):
+        """get the next character as a slice of the mapping (ASCII only, see class docstring)
+
+        Returns:
+            (str, None): the next character, None if we reached the end of stream
+        """
+        b = self._mm[self._pos : self._pos + 1]
+        if not b:
+            return None
+        self._pos += 1
+        return b.decode("ascii")
+
+    def get_batch(self, block_size: int) -> typing.List:
+        """return a batch of characters as a slice of the mapping (ASCII only, see class docstring)
+
+        the slice is pure pointer arithmetic over the mapped pages; no read syscall is issued
+        """
+        chunk = self._mm[self._pos : self._pos + block_size]
+        self._pos += len(chunk)
+        return list(chunk.decode("ascii"))
+
+    def write_symbol(self, s):
+        """writing is not supported for the mmap-backed stream"""
+        raise NotImplementedError("MmapTextFileDataStream is read-only")
 
 
 class Uint8FileDataStream(FileDataStream):
-    """reads Uint8 numbers written to a file"""
+    """reads Uint8 numbers written to a file
+
+    block reads/writes go directly through numpy, so a block is materialized as a single
+    vectorized read into a contiguous uint8 array (instead of one python-level read per byte)
+    """
+
+    __slots__ = ()
+
+    def __init__(self, file_path: str, permissions="rb", buffer_size: int = None):
+        """initialize the Uint8FileDataStream object (binary mode by default)"""
+        assert "b" in permissions, "Uint8FileDataStream needs a binary mode file"
+        super().__init__(file_path, permissions, buffer_size)
+
+    def get_batch(self, block_size: int) -> np.ndarray:
+        """read a batch of bytes as a contiguous numpy uint8 array in one vectorized read
+
+        NOTE: the returned DataBlock is backed by a np.ndarray rather than a python list;
+        downstream code can exploit the contiguous buffer (eg: np.bincount for counts)
+        """
+        try:
+            return np.fromfile(self.file_obj, dtype=np.uint8, count=block_size)
+        except (io.UnsupportedOperation, OSError):
+            # np.fromfile needs a real file descriptor; for buffer-backed file objects
+            # (eg: io.BytesIO) read the bytes and fill the array directly
+            return _uint8_array_from_bytes(self.file_obj.read(block_size))
+
+    def _symbols_from_bytes(self, data: bytes) -> np.ndarray:
+        """bytes map one-to-one onto uint8 symbols; see FileDataStream.get_blocks"""
+        return _uint8_array_from_bytes(data)
+
+    def get_block(self, block_size: int) -> DataBlock:
+        """returns a DataBlock wrapping a contiguous uint8 numpy array
+
+        Args:
+            block_size (int): the (max) size of the block of data to be returned.
+
+        Returns:
+            DataBlock:
+        """
+        arr = self.get_batch(block_size)
+        if arr.size == 0:
+            return None
+        return _make_block(arr)
+
+    def write_block(self, data_block: DataBlock):
+        """write the whole block to the file as raw bytes in one vectorized call
+
+        Args:
+            data_block (DataBlock): block to be written to the stream
+        """
+        # NOTE: np.asarray raises on python ints outside [0, 255], mirroring the
+        # per-symbol assert in write_symbol
+        np.asarray(data_block.data_list, dtype=np.uint8).tofile(self.file_obj)
 
     def get_symbol(self):
         """get the next byte from the text file as 8-bit unsigned int
@@ -258,6 +798,96 @@ class Uint8FileDataStream(FileDataStream):
         self.file_obj.write(bytes([s]))
 
 
+def run_pipeline(
+    source_stream: DataStream,
+    stages: typing.List[typing.Callable],
+    sink_stream: DataStream,
+    block_size: int = 1 << 16,
+    depth: int = 4,
+):
+    """run a block-processing pipeline with each stage on its own thread
+
+    Blocks flow source_stream -> stages[0] -> ... -> stages[-1] -> sink_stream, with every hop
+    connected by a bounded queue. Each stage is a callable mapping a DataBlock to a DataBlock.
+    Since every stage runs on its own thread, the wall-clock time approaches that of the
+    slowest stage instead of the sum of all stages: file I/O releases the GIL (as do numpy and
+    numba kernels), so the reader/writer genuinely overlap with compute stages.
+
+    A None block is used as the end-of-stream sentinel and is forwarded through every queue, so
+    each stage terminates once its upstream is exhausted. If a stage (or the source/sink)
+    raises, the sentinel is still forwarded so the whole pipeline shuts down, and the first
+    exception is re-raised in the caller after the threads are joined.
+
+    Args:
+        source_stream (DataStream): stream to read blocks from
+        stages (List[Callable]): per-block transformations, applied in order
+        sink_stream (DataStream): stream the final blocks are written to
+        block_size (int, optional): size of the blocks read from source_stream. Defaults to 64K.
+        depth (int, optional): max blocks buffered between adjacent stages. Defaults to 4.
+    """
+    queues = [queue.Queue(maxsize=depth) for _ in range(len(stages) + 1)]
+
+    # exceptions raised on the worker threads, re-raised in the caller after join
+    # (list.append is thread-safe, so no lock is needed)
+    errors = []
+
+    def drain(q):
+        """consume a queue until the sentinel, so upstream puts never block on a dead stage"""
+        while q.get() is not None:
+            pass
+
+    def reader():
+        try:
+            while True:
+                block = source_stream.get_block(block_size)
+                if block is None:
+                    break
+                queues[0].put(block)
+        except Exception as exc:
+            errors.append(exc)
+        finally:
+            # always forward the sentinel so downstream stages terminate
+            queues[0].put(None)
+
+    def stage_worker(stage_ind, stage_fn):
+        try:
+            while True:
+                block = queues[stage_ind].get()
+                if block is None:
+                    break
+                queues[stage_ind + 1].put(stage_fn(block))
+        except Exception as exc:
+            errors.append(exc)
+            drain(queues[stage_ind])
+        finally:
+            queues[stage_ind + 1].put(None)
+
+    def writer():
+        try:
+            while True:
+                block = queues[-1].get()
+                if block is None:
+                    break
+                sink_stream.write_block(block)
+        except Exception as exc:
+            errors.append(exc)
+            drain(queues[-1])
+
+    threads = (
+        [threading.Thread(target=reader)]
+        + [threading.Thread(target=stage_worker, args=(i, fn)) for i, fn in enumerate(stages)]
+        + [threading.Thread(target=writer)]
+    )
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # surface the first failure to the caller instead of swallowing it
+    if errors:
+        raise errors[0]
+
+
 #################################
 
 
@@ -316,6 +946,170 @@ def test_file_data_stream():
             assert block.data_list[0] == "_"
 
 
+def test_get_blocks_scatter_gather():
+    """check that the readv-based get_blocks returns the same data as repeated get_block"""
+
+    # create a temporary file
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        temp_file_path = os.path.join(tmpdirname, "tmp_file.txt")
+
+        data_gt = DataBlock([(3 * i) % 256 for i in range(100)])
+        with Uint8FileDataStream(temp_file_path, "wb") as fds:
+            fds.write_block(data_gt)
+
+        # uint8 stream: one readv fills several blocks (last one short)
+        with Uint8FileDataStream(temp_file_path, "rb") as fds:
+            blocks = fds.get_blocks(num_blocks=4, block_size=30)
+            assert [block.size for block in blocks] == [30, 30, 30, 10]
+            collected = []
+            for block in blocks:
+                collected.extend(block.data_list)
+            assert collected == data_gt.data_list
+
+        # ascii text stream: same mechanism, symbols are chars
+        text_gt = DataBlock(list("This-is_a_test_file"))
+        with TextFileDataStream(temp_file_path, "w", ascii_only=True) as fds:
+            fds.write_block(text_gt)
+        with TextFileDataStream(temp_file_path, "r", ascii_only=True) as fds:
+            blocks = fds.get_blocks(num_blocks=3, block_size=8)
+            collected = []
+            for block in blocks:
+                collected.extend(block.data_list)
+            assert collected == text_gt.data_list
+
+
+def test_run_pipeline():
+    """check that a staged pipeline produces the same output as sequential processing"""
+    input_list = list(range(100))
+    output_list = []
+
+    # two simple per-block stages: add 1 to each symbol, then double it
+    add_one = lambda block: DataBlock([s + 1 for s in block.data_list])
+    double = lambda block: DataBlock([2 * s for s in block.data_list])
+
+    with ListDataStream(input_list) as source, ListDataStream(output_list) as sink:
+        run_pipeline(source, [add_one, double], sink, block_size=7, depth=2)
+
+    assert output_list == [2 * (s + 1) for s in input_list]
+
+
+def test_run_pipeline_stage_error():
+    """check that a failing stage shuts the pipeline down and re-raises instead of hanging"""
+    input_list = list(range(100))
+    output_list = []
+
+    def failing_stage(block):
+        raise ValueError("stage failed")
+
+    with ListDataStream(input_list) as source, ListDataStream(output_list) as sink:
+        try:
+            run_pipeline(source, [failing_stage], sink, block_size=7, depth=2)
+            assert False, "expected the stage error to be re-raised"
+        except ValueError as exc:
+            assert str(exc) == "stage failed"
+
+
+def test_text_file_data_stream_ascii_only():
+    """check that the ascii_only fast path round-trips data like the text-mode path"""
+
+    # create a temporary file
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        temp_file_path = os.path.join(tmpdirname, "tmp_file.txt")
+
+        # write data through the ascii (binary-mode) path
+        data_gt = DataBlock(list("This-is_a_test_file"))
+        with TextFileDataStream(temp_file_path, "w", ascii_only=True) as fds:
+            fds.write_block(data_gt)
+
+        # read it back through the ascii path; symbols are still single-char strs
+        with TextFileDataStream(temp_file_path, "r", ascii_only=True) as fds:
+            block = fds.get_block(block_size=100)
+            assert block.data_list == data_gt.data_list
+
+        # the file is also readable through the regular text-mode path
+        with TextFileDataStream(temp_file_path, "r") as fds:
+            block = fds.get_block(block_size=100)
+            assert block.data_list == data_gt.data_list
+
+
+def test_list_data_stream_preallocated():
+    """check writes into a ListDataStream with a preallocated arena"""
+    output_list = []
+    with ListDataStream(output_list, capacity_hint=5) as ds:
+        # the arena is preallocated...
+        assert len(output_list) == 5
+
+        # ...and writes fill it in place before growing the list
+        ds.write_block(DataBlock([0, 1, 2]))
+        ds.write_block(DataBlock([3, 4, 5, 6]))
+        assert output_list == [0, 1, 2, 3, 4, 5, 6]
+
+
+def test_prefetching_data_stream():
+    """check that the prefetching wrapper returns the same blocks as the wrapped stream"""
+    input_list = list(range(10))
+    with ListDataStream(input_list) as ds:
+        prefetcher = PrefetchingDataStream(ds, block_size=3, depth=2)
+
+        collected = []
+        while True:
+            block = prefetcher.get_block(3)
+            if block is None:
+                break
+            collected.extend(block.data_list)
+        assert collected == input_list
+
+        # the stream stays exhausted
+        assert prefetcher.get_block(3) is None
+
+
+def test_mmap_text_file_data_stream():
+    """function to test the mmap-backed text file data stream"""
+
+    # create a temporary file
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        temp_file_path = os.path.join(tmpdirname, "tmp_file.txt")
+
+        # write data to the file
+        data_gt = DataBlock(list("This-is_a_test_file"))
+        with TextFileDataStream(temp_file_path, "w") as fds:
+            fds.write_block(data_gt)
+
+        # read data from the file via the mapping
+        with MmapTextFileDataStream(temp_file_path) as fds:
+            block = fds.get_block(block_size=4)
+            assert block.size == 4
+            assert block.data_list == list("This")
+
+            # try seeking and reading
+            fds.seek(4)
+            block = fds.get_block(block_size=4)
+            assert block.data_list[0] == "-"
+
+            # read until the end of the stream
+            fds.seek(0)
+            block = fds.get_block(block_size=100)
+            assert block.size == data_gt.size
+            assert fds.get_block(block_size=4) is None
+
+        # an empty file is served as an immediately-exhausted stream
+        empty_file_path = os.path.join(tmpdirname, "empty_file.txt")
+        open(empty_file_path, "w").close()
+        with MmapTextFileDataStream(empty_file_path) as fds:
+            assert fds.get_block(block_size=4) is None
+
+        # non-ASCII input fails loudly (the stream is single-byte only, see class docstring)
+        non_ascii_file_path = os.path.join(tmpdirname, "non_ascii_file.txt")
+        with open(non_ascii_file_path, "w") as f:
+            f.write("héllo")
+        with MmapTextFileDataStream(non_ascii_file_path) as fds:
+            try:
+                fds.get_block(block_size=2)
+                assert False, "expected UnicodeDecodeError for non-ASCII input"
+            except UnicodeDecodeError:
+                pass
+
+
 def test_uint8_file_data_stream():
     """function to test file data stream"""
 
@@ -333,12 +1127,13 @@ def test_uint8_file_data_stream():
             fds.write_symbol(99)
 
         # read data from the file
+        # NOTE: blocks read from Uint8FileDataStream are backed by numpy uint8 arrays
         with Uint8FileDataStream(temp_file_path, "rb") as fds:
             block = fds.get_block(block_size=4)
             assert block.size == 4
-            assert block.data_list == [5, 2, 255, 0]
+            assert list(block.data_list) == [5, 2, 255, 0]
 
             # try seeking and reading
             fds.seek(4)
             block = fds.get_block(block_size=4)
-            assert block.data_list == [99, 34]
+            assert list(block.data_list) == [99, 34]